@@ -1,6 +1,12 @@
 from __future__ import annotations
+import asyncio
+import os
+import sys
+import time
 from typing import Any, AsyncGenerator, Dict, Generator, Iterable, List, Optional
-import json
+
+import msgspec
+import orjson
 
 from .http import SyncHTTP, AsyncHTTP
 from .types import (
@@ -8,13 +14,60 @@ from .types import (
     ModelInfo,
     ChatCompletion,
     ChatCompletionRequest,
-    ChatCompletionChunk,
+    ChatChunk,
     StreamEvent,
+    _fast_build,
+    _MinChunk,
+    build_request,
 )
 
 MODELS_PATH = "/v1/models"
 CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
 
+# One decoder instance shared by all clients: msgspec decoders are immutable
+# and precompile the ChatChunk schema, so decoding an SSE line is a single
+# C-level parse+validate pass. The hot loop decodes only the minimal schema;
+# the full ChatChunk is materialized lazily when StreamEvent.raw is inspected.
+_CHUNK_DEC = msgspec.json.Decoder(ChatChunk)
+_MIN_DEC = msgspec.json.Decoder(_MinChunk)
+
+class _LazyChunk:
+    """Defers full chunk decoding until an attribute is actually read."""
+
+    __slots__ = ("_raw", "_chunk")
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+        self._chunk: Optional[ChatChunk] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._chunk is None:
+            self._chunk = _CHUNK_DEC.decode(self._raw)
+        return getattr(self._chunk, name)
+
+    def __repr__(self) -> str:
+        return f"_LazyChunk({self._raw!r})"
+
+# Request payloads are built from trusted kwargs, so by default we skip
+# pydantic and just filter the known schema keys. Set APERTUS_VALIDATE_REQUESTS
+# to route payloads through full ChatCompletionRequest validation instead.
+# Interned so that membership checks and the orjson key encoder can compare
+# pointers instead of hashing; kwargs keys from call syntax arrive interned.
+_ALLOWED_CHAT_KEYS = frozenset(sys.intern(k) for k in ChatCompletionRequest.model_fields)
+_VALIDATE_REQUESTS = bool(os.getenv("APERTUS_VALIDATE_REQUESTS"))
+
+def _build_chat_payload(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    if _VALIDATE_REQUESTS:
+        messages = kwargs.get("messages")
+        if type(messages) is orjson.Fragment:
+            # Pre-serialized histories can't be re-validated; validate the
+            # remaining fields and splice the fragment back in untouched.
+            payload = build_request({**kwargs, "messages": []})
+            payload["messages"] = messages
+            return payload
+        return build_request(kwargs)
+    return {k: v for k, v in kwargs.items() if v is not None and k in _ALLOWED_CHAT_KEYS}
+
 # Convenience sub-clients mirroring OpenAI structure
 
 class _Models:
@@ -24,7 +77,7 @@ class _Models:
     def list(self) -> ModelsList:
         data = self._http.get(MODELS_PATH)
         # Accept both OpenAI-format and generic list
-        return ModelsList.model_validate(data)
+        return _fast_build(ModelsList, data)
 
 class _AsyncModels:
     def __init__(self, http: AsyncHTTP):
@@ -32,74 +85,73 @@ class _AsyncModels:
 
     async def list(self) -> ModelsList:
         data = await self._http.get(MODELS_PATH)
-        return ModelsList.model_validate(data)
+        return _fast_build(ModelsList, data)
 
 class _ChatCompletions:
     def __init__(self, http: SyncHTTP):
         self._http = http
 
     def create(self, **kwargs) -> ChatCompletion:
-        payload = ChatCompletionRequest(**kwargs).model_dump(exclude_none=True)
+        payload = _build_chat_payload(kwargs)
         data = self._http.post_json(CHAT_COMPLETIONS_PATH, json=payload)
-        return ChatCompletion.model_validate(data)
+        return _fast_build(ChatCompletion, data)
 
     def stream(self, **kwargs) -> Generator[StreamEvent, None, None]:
         # Ensure stream flag is set
-        payload = ChatCompletionRequest(**{**kwargs, "stream": True}).model_dump(exclude_none=True)
+        payload = _build_chat_payload({**kwargs, "stream": True})
         for line in self._http.post_stream(CHAT_COMPLETIONS_PATH, json=payload):
-            # Expect SSE-like lines: possibly starting with 'data: {...}'
-            text = line.decode("utf-8") if isinstance(line, (bytes, bytearray)) else line
-            text = text.strip()
-            if not text:
+            # SSE frames look like b'data: {...}'. partition splits field
+            # name and value in one C call; non-data fields (event:, id:,
+            # comments) are skipped. The frame stays bytes end to end.
+            key, _, val = line.partition(b":")
+            if key != b"data":
                 continue
-            if text.startswith("data:"):
-                text = text[len("data:"):].strip()
-            if text == "[DONE]":
+            val = val.strip()
+            if not val:
+                continue
+            if val == b"[DONE]":
                 break
             try:
-                obj = json.loads(text)
-            except json.JSONDecodeError:
+                m = _MIN_DEC.decode(val)
+            except msgspec.DecodeError:
                 continue
-            chunk = ChatCompletionChunk.model_validate(obj)
             delta = None
-            if chunk.choices:
-                ch0 = chunk.choices[0]
-                if ch0.delta and ch0.delta.content is not None:
-                    delta = ch0.delta.content
-            yield StreamEvent(delta=delta, choice_index=0, raw=chunk)
+            if m.choices:
+                d = m.choices[0].delta
+                if d is not None:
+                    delta = d.get("content")
+            yield StreamEvent(delta, 0, _LazyChunk(val))
 
 class _AsyncChatCompletions:
     def __init__(self, http: AsyncHTTP):
         self._http = http
 
     async def create(self, **kwargs) -> ChatCompletion:
-        payload = ChatCompletionRequest(**kwargs).model_dump(exclude_none=True)
+        payload = _build_chat_payload(kwargs)
         data = await self._http.post_json(CHAT_COMPLETIONS_PATH, json=payload)
-        return ChatCompletion.model_validate(data)
+        return _fast_build(ChatCompletion, data)
 
     async def stream(self, **kwargs) -> AsyncGenerator[StreamEvent, None]:
-        payload = ChatCompletionRequest(**{**kwargs, "stream": True}).model_dump(exclude_none=True)
+        payload = _build_chat_payload({**kwargs, "stream": True})
         async for line in self._http.post_stream(CHAT_COMPLETIONS_PATH, json=payload):
-            text = line
-            text = text.decode("utf-8") if isinstance(text, (bytes, bytearray)) else text
-            text = text.strip()
-            if not text:
+            key, _, val = line.partition(b":")
+            if key != b"data":
+                continue
+            val = val.strip()
+            if not val:
                 continue
-            if text.startswith("data:"):
-                text = text[len("data:"):].strip()
-            if text == "[DONE]":
+            if val == b"[DONE]":
                 break
             try:
-                obj = json.loads(text)
-            except json.JSONDecodeError:
+                m = _MIN_DEC.decode(val)
+            except msgspec.DecodeError:
                 continue
-            chunk = ChatCompletionChunk.model_validate(obj)
             delta = None
-            if chunk.choices:
-                ch0 = chunk.choices[0]
-                if ch0.delta and ch0.delta.content is not None:
-                    delta = ch0.delta.content
-            yield StreamEvent(delta=delta, choice_index=0, raw=chunk)
+            if m.choices:
+                d = m.choices[0].delta
+                if d is not None:
+                    delta = d.get("content")
+            yield StreamEvent(delta, 0, _LazyChunk(val))
 
 class _Chat:
     def __init__(self, http: SyncHTTP):
@@ -110,13 +162,52 @@ class _AsyncChat:
         self.completions = _AsyncChatCompletions(http)
 
 class Apertus:
-    def __init__(self, api_key: Optional[str] = None, *, base_url: str = None, timeout: float = 30.0):
+    def __init__(self, api_key: Optional[str] = None, *, base_url: Optional[str] = None, timeout: float = 30.0):
         self._http = SyncHTTP(api_key=api_key, base_url=base_url or "https://api.publicai.co", timeout=timeout)
         self.models = _Models(self._http)
         self.chat = _Chat(self._http)
+        self._models_cache: Optional[tuple] = None  # (monotonic timestamp, ids)
+
+    def available_model_ids(self, ttl: float = 300.0) -> List[str]:
+        """Model ids available to this key, cached for ttl seconds.
+
+        Saves a network round-trip when the catalog is consulted repeatedly,
+        e.g. on every /model switch in a REPL.
+        """
+        now = time.monotonic()
+        cache = self._models_cache
+        if cache is not None and now - cache[0] < ttl:
+            return cache[1]
+        models = self.models.list()
+        ids = [m.id for m in models.data if m.id]
+        self._models_cache = (now, ids)
+        return ids
 
 class AsyncApertus:
-    def __init__(self, api_key: Optional[str] = None, *, base_url: str = None, timeout: float = 30.0):
-        self._http = AsyncHTTP(api_key=api_key, base_url=base_url or "https://api.publicai.co", timeout=timeout)
+    def __init__(self, api_key: Optional[str] = None, *, base_url: Optional[str] = None, timeout: float = 30.0, share_pool: bool = False):
+        # share_pool reuses one AsyncClient per (base_url, api_key, timeout)
+        # across AsyncApertus instances; pair with aclose() to release it.
+        self._http = AsyncHTTP(api_key=api_key, base_url=base_url or "https://api.publicai.co", timeout=timeout, share_pool=share_pool)
         self.models = _AsyncModels(self._http)
         self.chat = _AsyncChat(self._http)
+        self._models_cache: Optional[tuple] = None  # (monotonic timestamp, ids)
+        self._models_lock = asyncio.Lock()
+
+    async def available_model_ids(self, ttl: float = 300.0) -> List[str]:
+        """Model ids available to this key, cached for ttl seconds."""
+        cache = self._models_cache
+        if cache is not None and time.monotonic() - cache[0] < ttl:
+            return cache[1]
+        async with self._models_lock:
+            # Re-check: another task may have refreshed while we waited.
+            cache = self._models_cache
+            now = time.monotonic()
+            if cache is not None and now - cache[0] < ttl:
+                return cache[1]
+            models = await self.models.list()
+            ids = [m.id for m in models.data if m.id]
+            self._models_cache = (now, ids)
+            return ids
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
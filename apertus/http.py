@@ -3,11 +3,16 @@ import os
 from typing import Any, Dict, Generator, Iterable, Optional
 
 import httpx
+import orjson
 
 from .errors import ApertusAPIError
 
 DEFAULT_BASE_URL = "https://api.publicai.co"
 
+# Request bodies are encoded with orjson and sent via content= so httpx does
+# not fall back to stdlib json.dumps; the explicit header keeps the media type.
+_JSON_CT = {"Content-Type": "application/json"}
+
 class _BaseHTTP:
     def __init__(self, api_key: Optional[str] = None, base_url: str = DEFAULT_BASE_URL, timeout: float = 30.0):
         self.api_key = api_key or os.getenv("APERTUS_API_KEY")
@@ -15,44 +20,73 @@ class _BaseHTTP:
             raise ValueError("API key is required. Set APERTUS_API_KEY or pass api_key.")
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-
-    def _headers(self) -> Dict[str, str]:
-        return {
+        self._static_headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        # Keep connections warm: a chat session does one models list then many
+        # completions against the same host, so pooled keepalive sockets avoid
+        # repeated TLS handshakes.
+        self._limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0)
 
 class SyncHTTP(_BaseHTTP):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._client = httpx.Client(base_url=self.base_url, headers=self._headers(), timeout=self.timeout)
+        # http2/limits go on the transport: an explicit transport overrides the
+        # client-level pool settings.
+        transport = httpx.HTTPTransport(http2=True, limits=self._limits, retries=1)
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self._static_headers,
+            timeout=self.timeout,
+            transport=transport,
+        )
 
     def get(self, path: str) -> Dict[str, Any]:
         r = self._client.get(path)
         if r.status_code // 100 != 2:
             self._raise_api_error(r)
-        return r.json()
+        return orjson.loads(r.content)
 
     def post_json(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
-        r = self._client.post(path, json=json)
+        r = self._client.post(path, content=orjson.dumps(json), headers=_JSON_CT)
         if r.status_code // 100 != 2:
             self._raise_api_error(r)
-        return r.json()
+        return orjson.loads(r.content)
 
     def post_stream(self, path: str, json: Dict[str, Any]):
-        with self._client.stream("POST", path, json=json) as resp:
+        with self._client.stream("POST", path, content=orjson.dumps(json), headers=_JSON_CT) as resp:
             if resp.status_code // 100 != 2:
-                body = resp.read().decode("utf-8", errors="ignore")
-                self._raise_api_error_object(resp.status_code, body, url=str(resp.request.url), payload=json)
-            for line in resp.iter_lines():
-                if not line:
-                    continue
-                yield line
+                body = resp.read()
+                try:
+                    data = orjson.loads(body)
+                    message = data.get("error") or data.get("message") or body.decode("utf-8", errors="ignore")
+                except Exception:
+                    message = body.decode("utf-8", errors="ignore")
+                self._raise_api_error_object(resp.status_code, message, url=str(resp.request.url), payload=json)
+            # Split frames off the byte stream ourselves: iter_lines decodes
+            # to str and allocates per line, which adds up on token-dense
+            # streams. iter_bytes still applies Content-Encoding decoding
+            # (gzip'd event streams stay readable) but skips the str
+            # round-trip. One reusable buffer, chunks yielded as they arrive.
+            buf = bytearray()
+            for chunk in resp.iter_bytes():
+                buf.extend(chunk)
+                while True:
+                    nl = buf.find(b"\n")
+                    if nl < 0:
+                        break
+                    line = bytes(buf[:nl])
+                    del buf[: nl + 1]
+                    if line:
+                        yield line
+            if buf:
+                yield bytes(buf)
 
     def _raise_api_error(self, r: httpx.Response) -> None:
         try:
-            data = r.json()
+            data = orjson.loads(r.content)
             message = data.get("error") or data.get("message") or r.text
         except Exception:
             message = r.text
@@ -62,37 +96,94 @@ class SyncHTTP(_BaseHTTP):
     def _raise_api_error_object(self, status: int, message: str, *, url: Optional[str], payload: Optional[dict]):
         raise ApertusAPIError(status, message, url=url, payload=payload)
 
+# Shared AsyncClient pools keyed by (base_url, api_key, timeout), refcounted.
+# Frameworks that build an AsyncApertus per request would otherwise pay a
+# fresh TLS+TCP pool each time. Entries are [client, refcount]; lookups happen
+# in the synchronous __init__ so plain dict mutation under the GIL suffices.
+_SHARED_CLIENTS: Dict[tuple, list] = {}
+
 class AsyncHTTP(_BaseHTTP):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, share_pool: bool = False, **kwargs):
         super().__init__(*args, **kwargs)
-        self._client = httpx.AsyncClient(base_url=self.base_url, headers=self._headers(), timeout=self.timeout)
+        self._shared_key: Optional[tuple] = None
+        self._client: Optional[httpx.AsyncClient]
+        if share_pool:
+            key = (self.base_url, self.api_key, self.timeout)
+            entry = _SHARED_CLIENTS.get(key)
+            if entry is None:
+                entry = [self._build_client(), 0]
+                _SHARED_CLIENTS[key] = entry
+            entry[1] += 1
+            self._shared_key = key
+            self._client = entry[0]
+        else:
+            self._client = self._build_client()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=self._limits, retries=1)
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._static_headers,
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        # Idempotent: the first close drops our reference; later calls are
+        # no-ops and never touch a shared client other holders still use.
+        client, self._client = self._client, None
+        if client is None:
+            return
+        if self._shared_key is not None:
+            key, self._shared_key = self._shared_key, None
+            entry = _SHARED_CLIENTS.get(key)
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    _SHARED_CLIENTS.pop(key, None)
+                    await entry[0].aclose()
+        else:
+            await client.aclose()
 
     async def get(self, path: str) -> Dict[str, Any]:
         r = await self._client.get(path)
         if r.status_code // 100 != 2:
             await self._raise_api_error(r)
-        return r.json()
+        return orjson.loads(r.content)
 
     async def post_json(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
-        r = await self._client.post(path, json=json)
+        r = await self._client.post(path, content=orjson.dumps(json), headers=_JSON_CT)
         if r.status_code // 100 != 2:
             await self._raise_api_error(r)
-        return r.json()
+        return orjson.loads(r.content)
 
     async def post_stream(self, path: str, json: Dict[str, Any]):
-        async with self._client.stream("POST", path, json=json) as resp:
+        async with self._client.stream("POST", path, content=orjson.dumps(json), headers=_JSON_CT) as resp:
             if resp.status_code // 100 != 2:
                 body = await resp.aread()
-                message = body.decode("utf-8", errors="ignore")
+                try:
+                    data = orjson.loads(body)
+                    message = data.get("error") or data.get("message") or body.decode("utf-8", errors="ignore")
+                except Exception:
+                    message = body.decode("utf-8", errors="ignore")
                 await self._raise_api_error_object(resp.status_code, message, url=str(resp.request.url), payload=json)
-            async for line in resp.aiter_lines():
-                if not line:
-                    continue
-                yield line
+            buf = bytearray()
+            async for chunk in resp.aiter_bytes():
+                buf.extend(chunk)
+                while True:
+                    nl = buf.find(b"\n")
+                    if nl < 0:
+                        break
+                    line = bytes(buf[:nl])
+                    del buf[: nl + 1]
+                    if line:
+                        yield line
+            if buf:
+                yield bytes(buf)
 
     async def _raise_api_error(self, r: httpx.Response) -> None:
         try:
-            data = r.json()
+            data = orjson.loads(r.content)
             message = data.get("error") or data.get("message") or r.text
         except Exception:
             message = r.text
@@ -1,6 +1,13 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Type, Union, get_args, get_origin
+
+import msgspec
+# Import from the concrete submodules: pydantic's top-level __init__ routes
+# attribute access through lazy-import machinery that costs at interpreter
+# start, which matters for short-lived worker processes.
+from pydantic.fields import Field
+from pydantic.main import BaseModel
+from pydantic.type_adapter import TypeAdapter
 
 # Shared
 
@@ -60,15 +67,88 @@ class ChatCompletionChunk(BaseModel):
     model: Optional[str] = None
     choices: List[ChatChoice]
 
-class StreamEvent(BaseModel):
+# Streaming chunk structs (msgspec)
+#
+# The SSE stream decodes one chunk per token, so these use msgspec.Struct
+# instead of pydantic: msgspec parses and validates the JSON in a single C
+# pass, which keeps per-chunk decode cost off the tokens/sec critical path.
+
+class ChunkDelta(msgspec.Struct, frozen=True):
+    role: Optional[str] = None
+    content: Optional[str] = None
+
+class ChunkChoice(msgspec.Struct, frozen=True):
+    index: int = 0
+    delta: Optional[ChunkDelta] = None
+    finish_reason: Optional[str] = None
+
+class ChatChunk(msgspec.Struct, frozen=True):
+    choices: List[ChunkChoice] = []
+    id: Optional[str] = None
+    object: Optional[str] = None
+    created: Optional[int] = None
+    model: Optional[str] = None
+
+# Minimal view of a chunk for the hot loop: only the first choice's delta is
+# needed per frame, so decoding just this skips id/created/model/finish_reason.
+
+class _MinChoice(msgspec.Struct, frozen=True):
+    delta: Optional[Dict[str, Any]] = None
+
+class _MinChunk(msgspec.Struct, frozen=True):
+    choices: List[_MinChoice] = []
+
+class StreamEvent(NamedTuple):
     """High-level streaming event wrapper.
 
+    One StreamEvent is emitted per decoded chunk, so this is a NamedTuple
+    rather than a BaseModel: construction is a C-level tuple allocation with
+    no per-field validation.
+
     - delta: concatenated text delta for the first choice (common case)
     - raw: the raw chunk object from the provider
     """
     delta: Optional[str] = None
     choice_index: int = 0
-    raw: ChatCompletionChunk
+    raw: Any = None
+
+# Fast construction for trusted response payloads
+#
+# Response bodies come from our own deserializer of the provider's schema, so
+# full pydantic validation is redundant there. _fast_build walks model_fields
+# once and uses model_construct, which skips the validator chain entirely.
+
+def _convert_field(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union:
+        for arg in get_args(annotation):
+            if isinstance(arg, type) and issubclass(arg, BaseModel):
+                if isinstance(value, dict):
+                    return _fast_build(arg, value)
+            elif get_origin(arg) is list:
+                if isinstance(value, list):
+                    return _convert_field(arg, value)
+        return value
+    if origin is list:
+        (item,) = get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return [_fast_build(item, v) for v in value]
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _fast_build(annotation, value)
+    return value
+
+def _fast_build(cls: Type[BaseModel], data: Any) -> Any:
+    """Build a pydantic model from trusted data without running validators."""
+    if not isinstance(data, dict):
+        return data
+    values: Dict[str, Any] = {}
+    for name, field in cls.model_fields.items():
+        if name in data:
+            values[name] = _convert_field(field.annotation, data[name])
+    return cls.model_construct(**values)
 
 # Request schemas
 
@@ -87,3 +167,21 @@ class ChatCompletionRequest(BaseModel):
     user: Optional[str] = None
     tools: Optional[List[Dict[str, Any]]] = None
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
+
+# Pre-compiled validation entry points
+#
+# model_rebuild() resolves and compiles the core schemas once at import, and
+# the cached request adapter calls straight into pydantic-core, so the one
+# path that still validates skips per-call schema-readiness checks.
+# Responses and chunks don't get adapters: they are built via _fast_build
+# and msgspec respectively and never go through pydantic validation.
+
+ChatCompletionRequest.model_rebuild()
+ChatCompletion.model_rebuild()
+ChatCompletionChunk.model_rebuild()
+
+_REQ_ADAPTER = TypeAdapter(ChatCompletionRequest)
+
+def build_request(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate chat-completion kwargs and dump them without None fields."""
+    return _REQ_ADAPTER.dump_python(_REQ_ADAPTER.validate_python(kwargs), exclude_none=True)
@@ -17,13 +17,59 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+import time
 from typing import List, Dict, Optional
 
+import orjson
+
 from apertus import Apertus, ApertusAPIError
 
 
 PREFERRED_MODEL = "swiss-ai/apertus-70b-instruct"
 
+# Message dicts are rebuilt every turn; interned keys/role values keep their
+# dict lookups and JSON encoding on the pointer-comparison fast path.
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+_SYSTEM = sys.intern("system")
+_USER = sys.intern("user")
+_ASSISTANT = sys.intern("assistant")
+
+
+class Conversation:
+    """Chat history plus an incrementally encoded JSON copy.
+
+    Sending a request serializes the whole message list, so a naive history
+    re-encodes every past turn on every request — O(history) work per turn.
+    This keeps a comma-joined buffer of already-encoded messages and only
+    encodes the newly appended message; payload() splices the buffer into the
+    request body as a pre-serialized orjson.Fragment.
+    """
+
+    def __init__(self, system: Optional[str] = None):
+        self.system = system
+        self.messages: List[Dict[str, str]] = []
+        self._encoded = bytearray()
+        if system:
+            self.append(_SYSTEM, system)
+
+    def append(self, role: str, content: str) -> None:
+        msg = {_ROLE: role, _CONTENT: content}
+        self.messages.append(msg)
+        if self._encoded:
+            self._encoded += b","
+        self._encoded += orjson.dumps(msg)
+
+    def clear(self) -> None:
+        """Drop the history, keeping the system prompt if any."""
+        self.messages = []
+        self._encoded = bytearray()
+        if self.system:
+            self.append(_SYSTEM, self.system)
+
+    def payload(self) -> orjson.Fragment:
+        return orjson.Fragment(b"[" + bytes(self._encoded) + b"]")
+
 
 def choose_model(client: Apertus, preferred: Optional[str] = None) -> str:
     """Pick a model ID to use.
@@ -33,22 +79,27 @@ def choose_model(client: Apertus, preferred: Optional[str] = None) -> str:
 
     This is helpful because model availability can vary per key/account.
     """
-    models = client.models.list()
-    ids = [m.id for m in models.data if getattr(m, "id", None)]
-    if not ids:
+    # One pass over the catalog: collect the id set, the first id, and a
+    # close match (prefers an apertus-instruct model under a different name).
+    # The id list is cached on the client, so /model switches within the TTL
+    # don't re-hit /v1/models.
+    ids_set = set()
+    first_id = None
+    close_match = None
+    for mid in client.available_model_ids():
+        if first_id is None:
+            first_id = mid
+        ids_set.add(mid)
+        if close_match is None:
+            lowered = mid.lower()
+            if "apertus" in lowered and "instruct" in lowered:
+                close_match = mid
+    if first_id is None:
         raise RuntimeError("No models available for this API key.")
 
-    if preferred and preferred in ids:
+    if preferred and preferred in ids_set:
         return preferred
-
-    # Try to find a close match first (prefers 70B instruct if present under different name)
-    for candidate in ids:
-        cid = candidate.lower()
-        if "apertus" in cid and "instruct" in cid:
-            return candidate
-
-    # Fallback: the first available model
-    return ids[0]
+    return close_match or first_id
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -104,10 +155,8 @@ def main() -> int:
         return 1
 
     # Build the conversation history in OpenAI-like message format.
-    # We'll maintain a list of dicts like {"role": "user"|"assistant"|"system", "content": str}
-    messages: List[Dict[str, str]] = []
-    if args.system:
-        messages.append({"role": "system", "content": args.system})
+    # Conversation keeps the dicts plus an incrementally encoded JSON copy.
+    conversation = Conversation(args.system)
 
     print("\nApertus Terminal Chat Demo")
     print(f"Using model: {model_id}")
@@ -133,8 +182,7 @@ def main() -> int:
                 print_help()
                 continue
             if user == "/clear":
-                # keep the system prompt if any
-                messages = [m for m in messages if m["role"] == "system"]
+                conversation.clear()
                 print("History cleared.")
                 continue
             if user.startswith("/model "):
@@ -152,7 +200,7 @@ def main() -> int:
                 continue
 
             # Append the user's message to the conversation history
-            messages.append({"role": "user", "content": user})
+            conversation.append(_USER, user)
 
             print("Assistant: ", end="", flush=True)
             try:
@@ -160,28 +208,46 @@ def main() -> int:
                     # Non-streaming mode: single response payload
                     resp = client.chat.completions.create(
                         model=model_id,
-                        messages=messages,
+                        messages=conversation.payload(),
                         temperature=args.temperature,
                         max_tokens=args.max_tokens,
                     )
                     text = resp.choices[0].message.content
                     print(text)
-                    messages.append({"role": "assistant", "content": text})
+                    conversation.append(_ASSISTANT, text)
                 else:
-                    # Streaming mode: print tokens as they arrive, then save the final text to history
+                    # Streaming mode: print tokens as they arrive, then save the final text to history.
+                    # Writes are batched (~16 chars or 30 ms) so a long reply
+                    # costs dozens of write syscalls instead of one per token.
+                    # One delta list serves both printing and history:
+                    # `flushed` marks how much of it has been written so far.
                     chunks: List[str] = []
+                    out = sys.stdout
+                    flushed = 0
+                    pending_len = 0
+                    last_flush = time.monotonic()
                     for ev in client.chat.completions.stream(
                         model=model_id,
-                        messages=messages,
+                        messages=conversation.payload(),
                         temperature=args.temperature,
                         max_tokens=args.max_tokens,
                     ):
                         if ev.delta:
-                            print(ev.delta, end="", flush=True)
                             chunks.append(ev.delta)
+                            pending_len += len(ev.delta)
+                            now = time.monotonic()
+                            if pending_len >= 16 or now - last_flush > 0.03:
+                                out.write("".join(chunks[flushed:]))
+                                out.flush()
+                                flushed = len(chunks)
+                                pending_len = 0
+                                last_flush = now
+                    if flushed < len(chunks):
+                        out.write("".join(chunks[flushed:]))
+                        out.flush()
                     print()  # newline after stream
                     final_text = "".join(chunks)
-                    messages.append({"role": "assistant", "content": final_text})
+                    conversation.append(_ASSISTANT, final_text)
             except ApertusAPIError as e:
                 print(f"\n[API error {e.status_code}] {e.message}")
             except KeyboardInterrupt:
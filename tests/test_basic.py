@@ -1,11 +1,26 @@
+import gzip
 import os
+
+import httpx
 import pytest
 
 from apertus import Apertus
+from apertus.http import SyncHTTP
 
 API_KEY = os.getenv("APERTUS_API_KEY", "test-key")
 
 
+def make_stream_http(parts, headers=None):
+    """SyncHTTP whose transport streams the given byte chunks back."""
+    http = SyncHTTP(api_key=API_KEY, base_url="https://example.test")
+
+    def handler(request):
+        return httpx.Response(200, content=iter(parts), headers=headers)
+
+    http._client = httpx.Client(base_url="https://example.test", transport=httpx.MockTransport(handler))
+    return http
+
+
 def test_client_init():
     client = Apertus(api_key=API_KEY)
     assert client.models is not None
@@ -30,6 +45,29 @@ def test_models_list_builds_request(monkeypatch):
     assert models.object == "list"
 
 
+def test_available_model_ids_cached(monkeypatch):
+    client = Apertus(api_key=API_KEY)
+
+    calls = {"n": 0}
+
+    class FakeHTTP:
+        def get(self, path):
+            calls["n"] += 1
+            return {"object": "list", "data": [{"id": "m1"}, {"id": "m2"}]}
+
+    client._http = FakeHTTP()  # type: ignore
+    client.models._http = client._http  # type: ignore
+
+    ids = client.available_model_ids()
+    assert ids == ["m1", "m2"]
+    # Second call within the TTL is served from the cache
+    assert client.available_model_ids() is ids
+    assert calls["n"] == 1
+    # An expired TTL forces a refresh
+    assert client.available_model_ids(ttl=0.0) == ["m1", "m2"]
+    assert calls["n"] == 2
+
+
 def test_chat_create_builds_request(monkeypatch):
     client = Apertus(api_key=API_KEY)
 
@@ -60,6 +98,64 @@ def test_chat_create_builds_request(monkeypatch):
     assert resp.object == "chat.completion"
 
 
+def test_post_stream_frames_across_chunk_boundaries():
+    # Chunk boundaries fall mid-line; the last frame has no trailing newline.
+    parts = [
+        b'data: {"a"',
+        b': 1}\ndata: ',
+        b'{"b": 2}\n\ndata: [DONE]',
+    ]
+    http = make_stream_http(parts)
+    lines = list(http.post_stream("/v1/chat/completions", json={}))
+    assert lines == [b'data: {"a": 1}', b'data: {"b": 2}', b"data: [DONE]"]
+
+
+def test_post_stream_decodes_gzip_body():
+    body = gzip.compress(b'data: {"a": 1}\ndata: [DONE]\n')
+    http = make_stream_http([body], headers={"Content-Encoding": "gzip"})
+    lines = list(http.post_stream("/v1/chat/completions", json={}))
+    assert lines == [b'data: {"a": 1}', b"data: [DONE]"]
+
+
+def test_shared_pool_refcount_lifecycle():
+    import asyncio
+
+    from apertus import AsyncApertus
+    from apertus.http import _SHARED_CLIENTS
+
+    async def scenario():
+        a = AsyncApertus(api_key=API_KEY, share_pool=True)
+        b = AsyncApertus(api_key=API_KEY, share_pool=True)
+        shared = a._http._client
+        assert b._http._client is shared
+        assert len(_SHARED_CLIENTS) == 1
+
+        await a.aclose()
+        # Double close is a no-op and must not close the sibling's client
+        await a.aclose()
+        assert not shared.is_closed
+        assert len(_SHARED_CLIENTS) == 1
+
+        await b.aclose()
+        assert shared.is_closed
+        assert len(_SHARED_CLIENTS) == 0
+
+    asyncio.run(scenario())
+
+
+def test_build_chat_payload_validation_passes_fragments(monkeypatch):
+    import orjson
+
+    from apertus import client as client_mod
+
+    monkeypatch.setattr(client_mod, "_VALIDATE_REQUESTS", True)
+
+    frag = orjson.Fragment(b'[{"role": "user", "content": "hi"}]')
+    payload = client_mod._build_chat_payload({"model": "m", "messages": frag, "temperature": None})
+    # The pre-serialized fragment survives validation untouched
+    assert payload == {"model": "m", "messages": frag}
+
+
 def test_stream_parsing(monkeypatch):
     client = Apertus(api_key=API_KEY)
 